@@ -1,16 +1,36 @@
 """MCP Server entry point for the AnswerRocket MCP server."""
 
+import atexit
+import os
+import queue
 import sys
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from typing import cast, Literal
 from mcp_server.modes import LocalMode, RemoteMode
 from mcp_server.config import ServerConfig
-from mcp.server import FastMCP
 
 def setup_logging():
+    """Log to stderr from a background thread so request handlers never block on the write."""
+    # Read directly rather than via ServerConfig: logging has to be configured before
+    # ServerConfig.from_environment() runs, since it logs while parsing (and on errors).
+    level = os.getenv("MCP_LOG_LEVEL", "INFO").upper()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s'))
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # The listener's handler applies the real format; the queue side only renders the message.
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
     logging.basicConfig(
-        level=logging.INFO,
-        format='[%(asctime)s] %(levelname)s: %(message)s'
+        level=getattr(logging, level, logging.INFO),
+        handlers=[queue_handler],
     )
 
 
@@ -1,5 +1,6 @@
 """Monkeypatched version of FastMCP with starlette-context middleware support. We do this because the token verifier must point to the right place."""
 
+from contextlib import asynccontextmanager
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.routing import Mount, Route
@@ -23,6 +24,11 @@ class BaseURLPlugin(Plugin):
 class FastMCPExtended(FastMCP):
     """Extended FastMCP that includes starlette-context middleware."""
 
+    def __init__(self, *args, forwarded_allow_ips: str = "*", **kwargs):
+        super().__init__(*args, **kwargs)
+        # Read once from ServerConfig rather than from the environment at serve time.
+        self.forwarded_allow_ips = forwarded_allow_ips
+
     def _add_context_middleware(self, middleware_list: list[Middleware]) -> list[Middleware]:
         """Add starlette-context middleware to the middleware list."""
         context_middleware_instance = Middleware(
@@ -89,24 +95,34 @@ class FastMCPExtended(FastMCP):
         original_app = super().streamable_http_app()
         app = self._enhance_app_with_dynamic_middleware(original_app)
         
-        app.router.lifespan_context = lambda app: self.session_manager.run()
+        app.router.lifespan_context = self._lifespan
         
         return app
 
+    @asynccontextmanager
+    async def _lifespan(self, app: Starlette):
+        """Run the session manager and release the token verifier's HTTP client on shutdown."""
+        async with self.session_manager.run():
+            try:
+                yield
+            finally:
+                aclose = getattr(self._token_verifier, "aclose", None)
+                if aclose:
+                    await aclose()
+
     async def run_streamable_http_async(self) -> None:
         """Run the server using StreamableHTTP transport with custom uvicorn config."""
         import uvicorn
 
         starlette_app = self.streamable_http_app()
 
-        import os
         config = uvicorn.Config(
             app=starlette_app,
             host=self.settings.host,
             port=self.settings.port,
             log_level=self.settings.log_level.lower(),
             proxy_headers=True,
-            forwarded_allow_ips=os.getenv("MCP_FORWARDED_ALLOW_IPS", "*"),
+            forwarded_allow_ips=self.forwarded_allow_ips,
         )
         server = uvicorn.Server(config)
         await server.serve()
\ No newline at end of file
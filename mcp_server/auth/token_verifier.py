@@ -1,19 +1,36 @@
 """Lifted from https://github.com/modelcontextprotocol/python-sdk/blob/main/examples/servers/simple-auth/mcp_simple_auth/token_verifier.py"""
 
+import asyncio
 import logging
+import threading
+import time
+from urllib.parse import quote_plus, urlparse
 
+import jwt
 from mcp.server.auth.provider import AccessToken, TokenVerifier
 from mcp.shared.auth_utils import check_resource_allowed
 from starlette_context import context
 
+from mcp_server.utils.cache import TTLCache, token_digest
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to httpx's stdlib json decoding
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Introspection endpoints we are willing to send a token to (SSRF guard).
+_SAFE_ENDPOINT_PREFIXES = ("https://", "http://localhost", "http://127.0.0.1")
+_SAFE_ENDPOINT_HOST_MARKER = "local.answerrocket.com"
+
+_INTROSPECTION_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
 
 class IntrospectionTokenVerifier(TokenVerifier):
     """Token verifier that uses OAuth 2.0 Token Introspection (RFC 7662).
 
     TODO: Implement the following best production practices:
-    - Connection pooling and reuse
     - More sophisticated error handling
     - Rate limiting and retry logic
     - Comprehensive configuration options
@@ -27,77 +44,97 @@ class IntrospectionTokenVerifier(TokenVerifier):
         self.validate_resource = validate_resource
         # Allowlist of hosts we may send the token to (empty = unenforced, warns).
         self.allowed_hosts = tuple(allowed_hosts)
+        self._allowed_host_set = frozenset(self.allowed_hosts)
+        if not self.allowed_hosts:
+            logger.warning(
+                "MCP_ALLOWED_INTROSPECTION_HOSTS is not set; introspecting against "
+                "request-derived hosts without an allowlist."
+            )
+        self._client = None
+
+    def _get_client(self):
+        """Return the shared HTTP client, creating it on first use.
+
+        Reusing one pooled client keeps connections (and TLS sessions) to the
+        introspection endpoint alive across requests.
+        """
+        if self._client is None:
+            import httpx
+
+            # Configure secure HTTP client
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                verify=True,  # Enforce SSL verification
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def verify_token(self, token: str) -> AccessToken | None:
         """Verify token via introspection endpoint."""
-        import httpx
-        
         base_url = context.get("base_url", "").rstrip("/")
         introspection_endpoint = base_url + "/api/oauth2/introspect"
         server_url = base_url
         resource_url = base_url
-        
-        # Validate URL to prevent SSRF attacks
-        if not introspection_endpoint.startswith(("https://", "http://localhost", "http://127.0.0.1")) and not "local.answerrocket.com" in introspection_endpoint:
-            logger.warning(f"Rejecting introspection endpoint with unsafe scheme: {introspection_endpoint}")
+
+        if not self._endpoint_allowed(base_url, introspection_endpoint):
+            return None
+
+        client = self._get_client()
+        try:
+            response = await client.post(
+                introspection_endpoint,
+                content=b"token=" + quote_plus(token).encode("ascii"),
+                headers=_INTROSPECTION_HEADERS,
+            )
+
+            if response.status_code != 200:
+                logger.debug(f"Token introspection returned status {response.status_code}")
+                return None
+
+            data = orjson.loads(response.content) if orjson else response.json()
+            if not data.get("active", False):
+                return None
+
+            # RFC 8707 resource validation (only when --oauth-strict is set)
+            if self.validate_resource and not self._validate_resource(data, resource_url, server_url):
+                logger.warning(f"Token resource validation failed. Expected: {resource_url}")
+                return None
+
+            return AccessToken(
+                token=token,
+                client_id=data.get("client_id", "unknown"),
+                scopes=data.get("scope", "").split() if data.get("scope") else [],
+                expires_at=data.get("exp"),
+                resource=data.get("aud"),  # Include resource in token
+            )
+        except Exception:
+            logger.warning("Token introspection failed", exc_info=True)
             return None
 
+    def _endpoint_allowed(self, base_url: str, endpoint: str) -> bool:
+        """Check the SSRF guard and host allowlist before the token goes to ``endpoint``."""
+        # Validate URL to prevent SSRF attacks
+        if not endpoint.startswith(_SAFE_ENDPOINT_PREFIXES) and _SAFE_ENDPOINT_HOST_MARKER not in endpoint:
+            logger.warning(f"Rejecting introspection endpoint with unsafe scheme: {endpoint}")
+            return False
+
         # Enforce the host allowlist before sending the token (base_url is client-influenced).
-        from urllib.parse import urlparse
         host = urlparse(base_url).netloc
-        if self.allowed_hosts:
-            if host not in self.allowed_hosts:
+        if self._allowed_host_set:
+            if host not in self._allowed_host_set:
                 logger.warning(
                     f"Rejecting introspection: host {host!r} not in allowlist {self.allowed_hosts}"
                 )
-                return None
+                return False
         else:
-            logger.warning(
-                "MCP_ALLOWED_INTROSPECTION_HOSTS is not set; introspecting against "
-                f"request-derived host {host!r} without an allowlist."
-            )
-
-        # Configure secure HTTP client
-        timeout = httpx.Timeout(10.0, connect=5.0)
-        limits = httpx.Limits(max_connections=10, max_keepalive_connections=5)
-
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=limits,
-            verify=True,  # Enforce SSL verification
-        ) as client:
-            try:
-                response = await client.post(
-                    introspection_endpoint,
-                    data={"token": token},
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
-
-                if response.status_code != 200:
-                    logger.debug(f"Token introspection returned status {response.status_code}")
-                    return None
-
-                data = response.json()
-                if not data.get("active", False):
-                    return None
-
-                # RFC 8707 resource validation (only when --oauth-strict is set)
-                if self.validate_resource and not self._validate_resource(data, resource_url, server_url):
-                    logger.warning(f"Token resource validation failed. Expected: {resource_url}")
-                    return None
-
-                return AccessToken(
-                    token=token,
-                    client_id=data.get("client_id", "unknown"),
-                    scopes=data.get("scope", "").split() if data.get("scope") else [],
-                    expires_at=data.get("exp"),
-                    resource=data.get("aud"),  # Include resource in token
-                )
-            except Exception as e:
-                import traceback
-                traceback.print_exc()
-                logger.warning(f"Token introspection failed: {e}")
-                return None
+            logger.debug("Introspecting against unlisted request-derived host %r", host)
+        return True
 
     def _validate_resource(self, token_data: dict, resource_url: str, server_url: str) -> bool:
         """Validate token was issued for this resource server."""
@@ -107,6 +144,9 @@ class IntrospectionTokenVerifier(TokenVerifier):
         # Check 'aud' claim first (standard JWT audience)
         aud = token_data.get("aud")
         if isinstance(aud, list):
+            # Exact match is the common case; only fall back to hierarchical matching without it.
+            if resource_url.rstrip("/") in {audience.rstrip("/") for audience in aud}:
+                return True
             for audience in aud:
                 if self._is_valid_resource(audience.rstrip("/"), resource_url, server_url):
                     return True
@@ -122,4 +162,182 @@ class IntrospectionTokenVerifier(TokenVerifier):
         if not resource_url:
             return False
 
-        return check_resource_allowed(requested_resource=resource_url, configured_resource=resource)
\ No newline at end of file
+        return check_resource_allowed(requested_resource=resource_url, configured_resource=resource)
+
+class CachingIntrospectionTokenVerifier(IntrospectionTokenVerifier):
+    """Introspection verifier that remembers active tokens for a short time.
+
+    Results are keyed by the request's base URL and a digest of the token (raw
+    tokens are never stored as keys), live for ``min(cache_ttl, exp - now)`` and
+    are evicted least-recently-used beyond ``cache_size``. Rejections are not
+    cached, so revocation is picked up within ``cache_ttl``.
+    """
+
+    def __init__(self, *args, cache_ttl: float = 60.0, cache_size: int = 4096, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        # (base_url, token digest) -> AccessToken
+        self._cache = TTLCache(ttl=cache_ttl, maxsize=cache_size)
+
+    def _cache_key(self, token: str) -> tuple:
+        return (context.get("base_url", ""), token_digest(token))
+
+    def _remember(self, key: tuple, access_token: AccessToken):
+        ttl = self.cache_ttl
+        if access_token.expires_at:
+            ttl = min(ttl, access_token.expires_at - time.time())
+        if ttl > 0:
+            self._cache.set(key, access_token, ttl=ttl)
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        key = self._cache_key(token)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        access_token = await super().verify_token(token)
+        if access_token is not None:
+            self._remember(key, access_token)
+        return access_token
+
+
+# Stored in place of a JWKS client while a host's JWKS is known to be unavailable.
+_JWKS_UNAVAILABLE = object()
+
+
+class LocalJWTVerifier(CachingIntrospectionTokenVerifier):
+    """Verifies JWT access tokens locally against the AS's published JWKS.
+
+    Signing keys are fetched once per request-derived host from
+    ``{base_url}/.well-known/jwks.json`` (subject to the same SSRF guard and host
+    allowlist as introspection) and kept for ``jwks_ttl`` seconds. Tokens that are
+    not JWTs, or hosts that don't serve a JWKS, fall back to cached introspection;
+    a failed JWKS fetch is remembered for ``jwks_retry_after`` seconds. An unknown
+    ``kid`` triggers at most one key refresh per host in that window. Tokens must
+    have been issued by the request's base URL (``iss``). Locally verified tokens
+    are not checked for revocation before they expire.
+    """
+
+    def __init__(
+        self,
+        *args,
+        jwks_ttl: float = 86400.0,
+        jwks_retry_after: float = 300.0,
+        algorithms: tuple = ("RS256",),
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.jwks_ttl = jwks_ttl
+        self.jwks_retry_after = jwks_retry_after
+        self.algorithms = list(algorithms)
+        # base_url -> PyJWKClient (each keeps its own key cache), or _JWKS_UNAVAILABLE
+        self._jwks_clients = TTLCache(ttl=jwks_ttl, maxsize=64)
+        # base_url -> monotonic time of the last kid-miss refresh; written from worker threads
+        self._jwks_refreshed_at = TTLCache(ttl=jwks_retry_after, maxsize=64)
+        self._jwks_refresh_lock = threading.Lock()
+
+    def _get_jwks_client(self, base_url: str):
+        jwks_client = self._jwks_clients.get(base_url)
+        if jwks_client is None:
+            jwks_client = jwt.PyJWKClient(
+                base_url + "/.well-known/jwks.json",
+                cache_keys=False,
+                lifespan=self.jwks_ttl,
+                timeout=10,
+            )
+            self._jwks_clients.set(base_url, jwks_client)
+        return jwks_client
+
+    def _signing_key(self, jwks_client, base_url: str, kid):
+        """Find ``kid`` in the host's key set; refreshes at most once per ``jwks_retry_after``.
+
+        Runs in a worker thread (PyJWKClient fetches with urllib). Returns None for an
+        unknown key and raises ``jwt.PyJWKClientError`` when the JWKS can't be fetched.
+        """
+        for key in jwks_client.get_signing_keys():
+            if key.key_id == kid:
+                return key
+        with self._jwks_refresh_lock:
+            if self._jwks_refreshed_at.get(base_url) is not None:
+                return None
+            self._jwks_refreshed_at.set(base_url, time.monotonic())
+        for key in jwks_client.get_signing_keys(refresh=True):
+            if key.key_id == kid:
+                return key
+        return None
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        if token.count(".") != 2:
+            return await super().verify_token(token)
+
+        key = self._cache_key(token)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        base_url = context.get("base_url", "").rstrip("/")
+        if self._jwks_clients.get(base_url) is _JWKS_UNAVAILABLE:
+            return await super().verify_token(token)
+
+        jwks_endpoint = base_url + "/.well-known/jwks.json"
+        if not self._endpoint_allowed(base_url, jwks_endpoint):
+            return None
+
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except jwt.DecodeError:
+            return await super().verify_token(token)
+        except jwt.PyJWTError as e:
+            logger.debug("Rejecting JWT with malformed header: %s", e)
+            return None
+
+        try:
+            jwks_client = self._get_jwks_client(base_url)
+            signing_key = await asyncio.to_thread(self._signing_key, jwks_client, base_url, kid)
+        except jwt.PyJWKClientError:
+            logger.info(
+                "No usable JWKS at %s; using introspection for %.0fs", base_url, self.jwks_retry_after
+            )
+            self._jwks_clients.set(base_url, _JWKS_UNAVAILABLE, ttl=self.jwks_retry_after)
+            return await super().verify_token(token)
+
+        if signing_key is None:
+            logger.debug("Rejecting JWT with unknown signing key %r from %s", kid, base_url)
+            return None
+
+        try:
+            claims = jwt.decode(
+                token,
+                signing_key.key,
+                algorithms=self.algorithms,
+                options={"verify_aud": False, "require": ["exp", "iss"]},
+            )
+        except jwt.InvalidTokenError as e:
+            logger.debug("Rejecting JWT: %s", e)
+            return None
+
+        if str(claims["iss"]).rstrip("/") != base_url:
+            logger.warning("Rejecting JWT issued by %r. Expected: %s", claims["iss"], base_url)
+            return None
+
+        # The signature only proves who issued the claims, not that they are well-formed.
+        try:
+            # RFC 8707 resource validation (only when --oauth-strict is set)
+            if self.validate_resource and not self._validate_resource(claims, base_url, base_url):
+                logger.warning("Token resource validation failed. Expected: %s", base_url)
+                return None
+
+            scope = claims.get("scope") or claims.get("scp") or ""
+            access_token = AccessToken(
+                token=token,
+                client_id=claims.get("client_id") or claims.get("azp") or "unknown",
+                scopes=scope.split() if isinstance(scope, str) else list(scope),
+                expires_at=claims.get("exp"),
+                resource=claims.get("aud"),
+            )
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.debug("Rejecting JWT with malformed claims: %s", e)
+            return None
+        self._remember(key, access_token)
+        return access_token
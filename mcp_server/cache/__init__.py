@@ -0,0 +1,5 @@
+"""Persistent caches for the MCP server."""
+
+from .skill_cache import SkillDiskCache
+
+__all__ = ["SkillDiskCache"]
@@ -0,0 +1,96 @@
+"""On-disk cache of hydrated skill configs, so restarts don't wait on the network."""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from mcp_server.skill_parameter import HydratedSkillConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "maxai-mcp"
+
+
+class SkillDiskCache:
+    """Pickled skill configs keyed by AR URL, token and copilot.
+
+    Entries younger than ``ttl`` are served immediately (the caller is expected to
+    revalidate in the background); older entries are ignored.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, ttl: float = 300.0):
+        self.directory = Path(directory) if directory else DEFAULT_CACHE_DIR
+        self.ttl = ttl
+
+    def _path(self, ar_url: str, token: str, copilot_id: str) -> Path:
+        # Hash the key so neither the token nor the URL ends up in a file name.
+        digest = hashlib.sha256(f"{ar_url}\0{token}\0{copilot_id}".encode()).hexdigest()
+        return self.directory / f"{digest[:32]}.pkl"
+
+    def _is_private(self) -> bool:
+        """True if only the current user can write to the cache directory.
+
+        ``load`` unpickles whatever it finds, so a directory others can write to is not trusted.
+        """
+        if not hasattr(os, "getuid"):
+            # Windows reports every directory as 0o777; access there is governed by ACLs
+            # on the user profile, so there are no POSIX bits to check.
+            return True
+        st = self.directory.stat()
+        return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+    def _prune(self, keep: Path):
+        """Remove entries (and stray temp files) older than the TTL, e.g. left behind by rotated tokens."""
+        cutoff = time.time() - self.ttl
+        for entry in self.directory.iterdir():
+            if entry == keep or entry.suffix not in (".pkl", ".tmp"):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    entry.unlink()
+            except FileNotFoundError:
+                pass
+
+    def load(self, ar_url: str, token: str, copilot_id: str) -> Optional[Tuple[List[HydratedSkillConfig], float]]:
+        """Return ``(skill_configs, age_seconds)`` for a live entry, or None."""
+        path = self._path(ar_url, token, copilot_id)
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.ttl:
+                return None
+            if not self._is_private():
+                logger.warning("Ignoring skill cache in %s: directory is writable by other users", self.directory)
+                return None
+            with path.open("rb") as f:
+                skill_configs = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable skill cache %s: %s", path, e)
+            return None
+        return skill_configs, age
+
+    def store(self, ar_url: str, token: str, copilot_id: str, skill_configs: List[HydratedSkillConfig]):
+        """Atomically write skill configs for this key, pruning expired entries."""
+        path = self._path(ar_url, token, copilot_id)
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self._is_private():
+                logger.warning("Not writing skill cache to %s: directory is writable by other users", self.directory)
+                return
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(skill_configs, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._prune(keep=path)
+        except Exception as e:
+            logger.warning("Failed to write skill cache %s: %s", path, e)
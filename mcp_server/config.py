@@ -5,10 +5,12 @@ from typing import Optional
 from dataclasses import dataclass
 import logging
 
+# Hosts served over plain HTTP; anything else is assumed to sit behind TLS.
+_LOCAL_HOSTS = frozenset({"127.0.0.1", "localhost", "::1"})
 
-@dataclass
+@dataclass(frozen=True)
 class ServerConfig:
-    """Configuration for the MCP server."""
+    """Configuration for the MCP server, read once from the environment at startup."""
     
     mode: str
     ar_url: Optional[str]  # Only used for local mode
@@ -23,6 +25,8 @@ class ServerConfig:
     # Hosts the server may send bearer tokens to for introspection (empty = unenforced).
     allowed_introspection_hosts: tuple = ()
     forwarded_allow_ips: str = "*"
+    # How remote mode verifies bearer tokens: "introspection" (default) or "jwt" (local JWKS).
+    token_mode: str = "introspection"
     
     @classmethod
     def from_environment(cls) -> 'ServerConfig':
@@ -40,23 +44,30 @@ class ServerConfig:
         if transport not in ["stdio", "streamable-http"]:
             raise ValueError(f"Invalid MCP_TRANSPORT: {transport}. Must be 'stdio' or 'streamable-http'")
         
+        token_mode = os.getenv("MCP_TOKEN_MODE", "introspection").lower()
+
+        if token_mode not in ["introspection", "jwt"]:
+            raise ValueError(f"Invalid MCP_TOKEN_MODE: {token_mode}. Must be 'introspection' or 'jwt'")
+
         allowed_hosts = tuple(
             h.strip() for h in os.getenv("MCP_ALLOWED_INTROSPECTION_HOSTS", "").split(",") if h.strip()
         )
 
+        is_local = mode == "local"
         config = cls(
             mode=mode,
             ar_url=ar_url,
+            ar_token=os.getenv("AR_TOKEN") if is_local else None,
+            copilot_id=os.getenv("COPILOT_ID") if is_local else None,
             host=os.getenv("MCP_HOST", "localhost"),
             port=int(os.getenv("MCP_PORT", "9090")),
             transport=transport,
             allowed_introspection_hosts=allowed_hosts,
             forwarded_allow_ips=os.getenv("MCP_FORWARDED_ALLOW_IPS", "*"),
+            token_mode=token_mode,
         )
         
-        if mode == "local":
-            config.ar_token = os.getenv("AR_TOKEN")
-            config.copilot_id = os.getenv("COPILOT_ID")
+        if is_local:
             config.validate_local_mode()
         else:
             config.validate_remote_mode()
@@ -85,8 +96,11 @@ class ServerConfig:
     @property
     def resource_server_url(self) -> str:
         """Get resource server URL for remote mode."""
-        protocol = "http" if self.host in ["127.0.0.1", "localhost"] else "https"
-        return f"{protocol}://{self.host}:{self.port}"
+        bare_host = self.host.strip("[]")
+        protocol = "http" if bare_host in _LOCAL_HOSTS else "https"
+        # IPv6 literals need brackets in a URL; don't double them if already present.
+        host = f"[{bare_host}]" if ":" in bare_host else self.host
+        return f"{protocol}://{host}:{self.port}"
     
     @property
     def is_local(self) -> bool:
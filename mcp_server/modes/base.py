@@ -1,13 +1,15 @@
 """Base mode handler for the MCP server."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
-from answer_rocket.client import AnswerRocketClient
-from answer_rocket.graphql.schema import MaxCopilot
+from typing import Optional, TYPE_CHECKING
 
 from mcp_server.config import ServerConfig
 from mcp_server.auth.fastmcp_extended import FastMCPExtended
 
+if TYPE_CHECKING:
+    from answer_rocket.client import AnswerRocketClient
+    from answer_rocket.graphql.schema import MaxCopilot
+
 
 class BaseMode(ABC):
     """Abstract base class for mode handlers."""
@@ -15,8 +17,8 @@ class BaseMode(ABC):
     def __init__(self, config: ServerConfig):
         self.config = config
         self.mcp: Optional[FastMCPExtended] = None
-        self.client: Optional[AnswerRocketClient] = None
-        self.copilot: Optional[MaxCopilot] = None
+        self.client: Optional["AnswerRocketClient"] = None
+        self.copilot: Optional["MaxCopilot"] = None
     
     @abstractmethod
     def create_mcp_server(self) -> FastMCPExtended:
@@ -32,13 +34,16 @@ class BaseMode(ABC):
         if not self.mcp:
             return
 
+        from mcp_server.cache import SkillDiskCache
         from mcp_server.tool_registry import ToolRegistry
         
         registry = ToolRegistry(
             mcp=self.mcp,
             ar_url=self.config.ar_url,
             ar_token=getattr(self.config, 'ar_token', None),
-            copilot_id=getattr(self.config, 'copilot_id', None)
+            copilot_id=getattr(self.config, 'copilot_id', None),
+            # Local mode restarts with every desktop session; remote servers are long-lived.
+            skill_disk_cache=SkillDiskCache() if self.config.is_local else None,
         )
         
         registry.setup_dynamic_registration()
@@ -1,8 +1,5 @@
 """Local mode handler for the MCP server."""
 
-import logging
-from answer_rocket.client import AnswerRocketClient
-
 from mcp_server.config import ServerConfig
 from mcp_server.modes.base import BaseMode
 from mcp_server.utils import FastMCPExtended
@@ -13,6 +10,8 @@ class LocalMode(BaseMode):
     
     def create_mcp_server(self) -> FastMCPExtended:
         """Create MCP server for local mode."""
+        from answer_rocket.client import AnswerRocketClient
+
         self.client = AnswerRocketClient(self.config.ar_url, self.config.ar_token)
         if not self.client.can_connect():
             raise ConnectionError(f"Cannot connect to AnswerRocket at {self.config.ar_url}")
@@ -25,6 +24,7 @@ class LocalMode(BaseMode):
         return FastMCPExtended(
             copilot_name,
             host=self.config.host,
-            port=self.config.port
+            port=self.config.port,
+            forwarded_allow_ips=self.config.forwarded_allow_ips,
         )
     
@@ -4,17 +4,25 @@ import logging
 from pydantic import AnyHttpUrl
 from mcp.server.auth.settings import AuthSettings
 
-from mcp_server.auth.token_verifier import IntrospectionTokenVerifier
+from mcp_server.auth.token_verifier import CachingIntrospectionTokenVerifier, LocalJWTVerifier
 from mcp_server.modes.base import BaseMode
 from mcp_server.utils import FastMCPExtended
 
+_SERVER_NAME = "AnswerRocket MCP Server"
+
+# Placeholder - real URLs come from request context
+_PLACEHOLDER_ISSUER_URL = AnyHttpUrl("http://localhost")
+
+_REQUIRED_SCOPES = ('read:copilots', 'read:copilotSkills', 'execute:copilotSkills', 'ping')
+
 
 class RemoteMode(BaseMode):
     """Handler for remote mode with OAuth authentication."""
     
     def create_mcp_server(self) -> FastMCPExtended:
         """Create MCP server for remote mode with OAuth."""
-        token_verifier = IntrospectionTokenVerifier(
+        verifier_cls = LocalJWTVerifier if self.config.token_mode == "jwt" else CachingIntrospectionTokenVerifier
+        token_verifier = verifier_cls(
             validate_resource=True,
             allowed_hosts=self.config.allowed_introspection_hosts,
         )
@@ -22,19 +30,20 @@ class RemoteMode(BaseMode):
         # Create MCP server with OAuth and support for our multi-tenant architecture
         # The MCP server will accept connections at /mcp/agent/{copilot_id}
         mcp_server = FastMCPExtended(
-            "AnswerRocket MCP Server",
+            _SERVER_NAME,
             token_verifier=token_verifier,
             auth=AuthSettings(
-                issuer_url=AnyHttpUrl("http://localhost"), # Placeholder - real URLs come from request context
+                issuer_url=_PLACEHOLDER_ISSUER_URL,
                 # I have verified that removing the issuer_url doesn't have any security implications
                 # It only is responsible for creating the /.well-known/oauth-protected-resource which we don't use
-                required_scopes=['read:copilots', 'read:copilotSkills', 'execute:copilotSkills', 'ping'],
+                required_scopes=list(_REQUIRED_SCOPES),
                 resource_server_url=None
                 # I have verified that the resource_server_url doesn't have any security implications
                 # It only is responsible for creating the /.well-known/oauth-protected-resource which we don't use
             ),
             host=self.config.host,
             port=self.config.port,
+            forwarded_allow_ips=self.config.forwarded_allow_ips,
         )
         
         mcp_server.settings.streamable_http_path = "/mcp/agent/{copilot_id:uuid}/"
@@ -1,10 +1,18 @@
 """Type definitions and models for the MCP server."""
 
-from typing import Any, Dict, List, Optional
+import logging
+import sys
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 from dataclasses import dataclass
 from uuid import UUID
 
-from answer_rocket.config import HydratedReport
+from mcp.types import ToolAnnotations
+
+if TYPE_CHECKING:
+    from answer_rocket.config import HydratedReport
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -17,6 +25,11 @@ class SkillParameter:
     is_multi: bool
     metadata_field: str
     constrained_values: Optional[List[str]]
+
+    @cached_property
+    def constrained_values_set(self) -> frozenset:
+        """Allowed values as a set for membership checks (the list keeps display order)."""
+        return frozenset(self.constrained_values or ())
     
     @classmethod
     def from_hydrated_parameter(cls, param_dict: Dict[str, Any]) -> Optional['SkillParameter']:
@@ -27,6 +40,8 @@ class SkillParameter:
         param_name = param_dict['key']
         if not param_name:
             return None
+        # Used as a kwarg key on every tool call
+        param_name = sys.intern(param_name)
 
         is_multi = param_dict['is_multi']
 
@@ -71,7 +86,7 @@ class HydratedSkillConfig:
     parameters: List[SkillParameter]
     
     @classmethod
-    def from_hydrated_report(cls, report: HydratedReport) -> Optional['HydratedSkillConfig']:
+    def from_hydrated_report(cls, report: "HydratedReport") -> Optional['HydratedSkillConfig']:
         """Create HydratedSkillConfig from hydrated report."""
         try:
             copilot_skill_id = report.copilot_skill_id
@@ -86,7 +101,7 @@ class HydratedSkillConfig:
             
             # Generate tool name from skill name
             safe_name = "".join(c if c.isalnum() or c == '_' else '_' for c in name.lower())
-            tool_name = safe_name.strip('_') or f"skill_{copilot_skill_id}"
+            tool_name = sys.intern(safe_name.strip('_') or f"skill_{copilot_skill_id}")
             
             # Parse dataset ID
             dataset_id = None
@@ -116,10 +131,16 @@ class HydratedSkillConfig:
                 parameters=parameters,
             )
         except Exception as e:
-            import logging
-            logging.error(f"Error creating HydratedSkillConfig from report: {e}")
+            logger.error("Error creating HydratedSkillConfig from report: %s", e)
             return None
     
+    def __getstate__(self):
+        # Closures aren't picklable; drop the compiled validator and let it be
+        # rebuilt on first use after loading.
+        state = dict(self.__dict__)
+        state.pop("argument_validator", None)
+        return state
+
     @property
     def skill_name(self) -> str:
         """Get the skill name."""
@@ -133,4 +154,34 @@ class HydratedSkillConfig:
     @property
     def detailed_name(self) -> str:
         """Get detailed name (fallback to name since detailed_name not in hydrated reports)."""
-        return self.name
\ No newline at end of file
+        return self.name
+
+    @cached_property
+    def required_parameter_names(self) -> frozenset:
+        """Names of the parameters a call must supply."""
+        return frozenset(param.name for param in self.parameters if param.required)
+
+    @cached_property
+    def parameter_specs(self) -> Dict[str, tuple]:
+        """``name -> (is_multi, constrained_values, constrained_values_set)``, flattened once for validation."""
+        return {
+            param.name: (param.is_multi, param.constrained_values, param.constrained_values_set)
+            for param in self.parameters
+        }
+
+    @cached_property
+    def argument_validator(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Compiled argument validator for this skill, built once per config."""
+        from mcp_server.utils.validation import ArgumentValidator
+        return ArgumentValidator.compile_validator(self)
+
+    @cached_property
+    def annotations(self) -> ToolAnnotations:
+        """MCP tool annotations for this skill, built once per config."""
+        return ToolAnnotations(
+            title=self.detailed_name,
+            readOnlyHint=not self.is_scheduling_only,
+            destructiveHint=False,
+            idempotentHint=True,
+            openWorldHint=True
+        )
@@ -5,9 +5,12 @@ import logging
 from typing import List, Optional, Callable
 from mcp.server import FastMCP
 
+from mcp_server.cache import SkillDiskCache
 from mcp_server.skill_parameter import HydratedSkillConfig
 from mcp_server.utils import ToolFactory, SkillService, RequestContextExtractor, ClientManager
-from answer_rocket.client import AnswerRocketClient
+from mcp_server.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
 
 class ToolRegistry:
     """Manages dynamic registration of skills as MCP tools.
@@ -22,46 +25,54 @@ class ToolRegistry:
         ar_url: str,
         ar_token: Optional[str] = None,
         copilot_id: Optional[str] = None,
+        skill_disk_cache: Optional[SkillDiskCache] = None,
     ):
         self.mcp = mcp
         self.ar_url = ar_url
         self.ar_token = ar_token
         self.copilot_id = copilot_id
+        self._tool_factory = ToolFactory.make_skill_tool_factory(ar_url, ar_token, copilot_id)
         self._original_list_tools = None
         # Serialize the shared-tool-store mutation so concurrent list_tools() calls don't race.
         self._registration_lock = asyncio.Lock()
-        # Short-lived per-copilot skill cache: copilot_id -> (expires_at, skill_configs).
-        self._skill_cache: dict = {}
-        self._skill_cache_ttl = 30.0
+        # Optional persistent cache (local mode): served immediately, then revalidated in the background.
+        self._skill_disk_cache = skill_disk_cache
+        self._refresh_tasks: dict = {}
+        self._notification_tasks: set = set()
+        # What the shared tool store currently holds, so unchanged list_tools() calls skip re-registration.
+        self._registered_copilot_id: Optional[str] = None
+        self._registered_key = None
+        # Built tools per (copilot_id, ar_url), swapped back in when a listing switches copilots.
+        self._tool_snapshots = TTLCache(ttl=3600.0, maxsize=32)
+        # Built tools per (ar_url, tool_name), so a partial skill change only rebuilds what changed.
+        self._built_tools = TTLCache(ttl=3600.0, maxsize=1024)
     
-    def register_skills(self, skill_configs: List[HydratedSkillConfig]):
-        """Register multiple skills as MCP tools."""
+    def register_skills(self, skill_configs: List[HydratedSkillConfig], tool_factory: Optional[Callable] = None):
+        """Register multiple skills as MCP tools.
+
+        ``tool_factory`` overrides the registry's own bound factory, e.g. to use the
+        request-derived AR URL in remote mode.
+        """
+        tool_factory = tool_factory or self._tool_factory
         for skill_config in skill_configs:
             try:
-                self.register_skill(skill_config)
+                self.register_skill(skill_config, tool_factory)
             except Exception as e:
-                logging.error(f"Failed to register skill {skill_config.skill_name}: {e}")
+                logger.error("Failed to register skill %s: %s", skill_config.skill_name, e)
     
-    def register_skill(self, skill_config: HydratedSkillConfig):
+    def register_skill(self, skill_config: HydratedSkillConfig, tool_factory: Optional[Callable] = None):
         """Register a single skill as an MCP tool."""
-        tool_func = ToolFactory.create_skill_tool_function(
-            skill_config,
-            self.ar_url,
-            self.ar_token,
-            self.copilot_id
-        )
-        
-        annotations = ToolFactory.create_tool_annotations(skill_config)
+        tool_func = (tool_factory or self._tool_factory)(skill_config)
         
         self.mcp.add_tool(
             tool_func,
             name=skill_config.tool_name,
             description=skill_config.detailed_description,
-            annotations=annotations,
+            annotations=skill_config.annotations,
             structured_output=True
         )
 
-        logging.info(f"Registered tool: {skill_config.tool_name}")
+        logger.debug("Registered tool: %s", skill_config.tool_name)
     
     def setup_dynamic_registration(self):
         """Set up dynamic tool registration."""
@@ -79,13 +90,16 @@ class ToolRegistry:
 
     async def _locked_list_tools(self, copilot_id: Optional[str]):
         async with self._registration_lock:
-            self.clear_tools()
-            
             if not copilot_id:
-                logging.error("No copilot_id available for tool registration")
+                self.clear_tools()
+                logger.error("No copilot_id available for tool registration")
                 return await self._original_list_tools()
-            
+
+            if copilot_id != self._registered_copilot_id:
+                self.clear_tools()
+
             await self._register_dynamic_tools(copilot_id)
+            self._registered_copilot_id = copilot_id
 
             #self.register_refresh_tool()
             
@@ -104,65 +118,163 @@ class ToolRegistry:
             if copilot_id:
                 return copilot_id
 
-    async def _register_dynamic_tools(self, copilot_id: str):
-        """Register tools dynamically for a specific copilot."""
+    async def _register_dynamic_tools(self, copilot_id: str, refresh: bool = False):
+        """Register tools dynamically for a specific copilot.
+
+        ``refresh`` bypasses the disk cache so the skills are re-fetched.
+        """
         context = self.mcp.get_context()
 
         if context and not self.ar_url:
             # remote mode
-            ar_url = str(context.request_context.request.base_url).rstrip("/")
-            client = ClientManager.create_client_from_context(context, ar_url)
+            ar_url = RequestContextExtractor.extract_ar_url(context)
+            token = RequestContextExtractor.extract_bearer_token(context)
         else:
             # local mode
             if not self.ar_token:
-                logging.error("AR token required for tool registration")
+                self.clear_tools()
+                logger.error("AR token required for tool registration")
                 return
             ar_url = self.ar_url
-            client = AnswerRocketClient(ar_url, self.ar_token)
-        
+            token = self.ar_token
+
+        client = None
+        if token:
+            try:
+                client = ClientManager.get_client(ar_url, token)
+            except Exception as e:
+                logger.error("Error creating client: %s", e)
+
         if not client:
-            logging.error("Failed to create AnswerRocket client")
+            self.clear_tools()
+            logger.error("Failed to create AnswerRocket client")
             return
 
-        skill_configs = self._get_skill_configs(client, copilot_id)
+        skill_configs = await self._get_skill_configs(client, ar_url, token, copilot_id, refresh)
+
+        registration_key = (copilot_id, ar_url, skill_configs)
+        previous_key = self._registered_key
+        if skill_configs and registration_key == previous_key:
+            logger.debug("Skills unchanged for copilot %s; reusing registered tools", copilot_id)
+            return
+
+        self.clear_tools()
+        # The same copilot's skills changed under it: tell the client to re-list.
+        if skill_configs and previous_key and previous_key[:2] == registration_key[:2]:
+            self.notify_tool_list_changed()
 
         if skill_configs:
+            snapshot = self._tool_snapshots.get((copilot_id, ar_url))
+            if snapshot and snapshot[0] == skill_configs:
+                self.mcp._tool_manager._tools.update(snapshot[1])
+                self._registered_key = registration_key
+                logger.debug("Restored %d tools for copilot %s", len(snapshot[1]), copilot_id)
+                return
+
             # Bind the static copilot id (None in remote mode) so tools resolve their
             # copilot from the request context at call time, not whoever registered them.
-            temp_registry = ToolRegistry(
-                mcp=self.mcp,
-                ar_url=ar_url,
-                ar_token=self.ar_token,
-                copilot_id=self.copilot_id,
+            tool_factory = (
+                self._tool_factory if ar_url == self.ar_url
+                else ToolFactory.make_skill_tool_factory(ar_url, self.ar_token, self.copilot_id)
+            )
+            self._register_skills_reusing_built(skill_configs, ar_url, tool_factory)
+            self._registered_key = registration_key
+            self._tool_snapshots.set(
+                (copilot_id, ar_url), (skill_configs, dict(self.mcp._tool_manager._tools))
             )
-            temp_registry.register_skills(skill_configs)
-            
 
-            logging.info(f"Registered {len(skill_configs)} skills for copilot {copilot_id}")
+            logger.info("Registered %d skills for copilot %s", len(skill_configs), copilot_id)
         else:
-            logging.warning(f"No skills found for copilot {copilot_id}")
+            logger.warning("No skills found for copilot %s", copilot_id)
 
-    def _get_skill_configs(self, client, copilot_id: str) -> List[HydratedSkillConfig]:
-        """Fetch a copilot's skill configs via the cache (caller holds the lock)."""
-        import time
-        cached = self._skill_cache.get(copilot_id)
-        if cached and cached[0] > time.monotonic():
-            logging.info(f"Using cached skills for copilot {copilot_id}")
-            return cached[1]
+    def _register_skills_reusing_built(self, skill_configs: List[HydratedSkillConfig], ar_url: str, tool_factory: Callable):
+        """Register skills, reusing the built tool for any skill whose config is unchanged."""
+        tools = self.mcp._tool_manager._tools
+        to_build = []
+        for skill_config in skill_configs:
+            built = self._built_tools.get((ar_url, skill_config.tool_name))
+            if built and built[0] == skill_config:
+                tools[skill_config.tool_name] = built[1]
+            else:
+                to_build.append(skill_config)
 
-        skill_configs = SkillService.fetch_hydrated_reports(client, copilot_id)
-        if skill_configs:
-            self._skill_cache[copilot_id] = (time.monotonic() + self._skill_cache_ttl, skill_configs)
+        if to_build:
+            self.register_skills(to_build, tool_factory)
+            for skill_config in to_build:
+                tool = tools.get(skill_config.tool_name)
+                if tool is not None:
+                    self._built_tools.set((ar_url, skill_config.tool_name), (skill_config, tool))
+
+    async def _get_skill_configs(self, client, ar_url: str, token: str, copilot_id: str, refresh: bool = False) -> List[HydratedSkillConfig]:
+        """Fetch a copilot's skill configs via the caches (caller holds the lock)."""
+        key = SkillService.cache_key(ar_url, token, copilot_id)
+        skill_configs = SkillService.get_cached_skill_configs(key)
+        if skill_configs is not None:
+            logger.debug("Using cached skills for copilot %s", copilot_id)
+            return skill_configs
+
+        if self._skill_disk_cache and not refresh:
+            stored = self._skill_disk_cache.load(ar_url, token, copilot_id)
+            if stored:
+                skill_configs, age = stored
+                logger.info("Using skills for copilot %s from disk cache (%.0fs old)", copilot_id, age)
+                SkillService.cache_skill_configs(key, skill_configs)
+                self._schedule_skill_refresh(client, ar_url, token, copilot_id)
+                return skill_configs
+
+        # The SDK call is blocking; keep it off the event loop so other sessions keep being served.
+        skill_configs = await asyncio.to_thread(SkillService.fetch_hydrated_reports, client, copilot_id)
+        self._cache_skill_configs(ar_url, token, copilot_id, skill_configs)
         return skill_configs
-    
+
+    def _cache_skill_configs(self, ar_url: str, token: str, copilot_id: str, skill_configs: List[HydratedSkillConfig]):
+        if not skill_configs:
+            return
+        SkillService.cache_skill_configs(SkillService.cache_key(ar_url, token, copilot_id), skill_configs)
+        if self._skill_disk_cache:
+            self._skill_disk_cache.store(ar_url, token, copilot_id, skill_configs)
+
+    def _schedule_skill_refresh(self, client, ar_url: str, token: str, copilot_id: str):
+        """Revalidate disk-cached skills without blocking the current list_tools() call."""
+        pending = self._refresh_tasks.get(copilot_id)
+        if pending and not pending.done():
+            return
+
+        async def refresh():
+            try:
+                skill_configs = await asyncio.to_thread(SkillService.fetch_hydrated_reports, client, copilot_id)
+                self._cache_skill_configs(ar_url, token, copilot_id, skill_configs)
+            finally:
+                self._refresh_tasks.pop(copilot_id, None)
+
+        task = asyncio.create_task(refresh())
+        task.add_done_callback(self._on_skill_refresh_done)
+        self._refresh_tasks[copilot_id] = task
+
+    @staticmethod
+    def _on_skill_refresh_done(task: asyncio.Task):
+        if not task.cancelled() and task.exception():
+            logger.error("Failed to revalidate cached skills: %s", task.exception())
 
     async def send_tool_list_changed(self):
         """Send tool list changed notification."""
         context = self.mcp.get_context()
         if context and context._request_context:
             await context.session.send_tool_list_changed()
-            logging.info("Sent tool list changed notification")
+            logger.info("Sent tool list changed notification")
     
+    def notify_tool_list_changed(self) -> asyncio.Task:
+        """Send the tool list changed notification in the background, logging any failure."""
+        task = asyncio.create_task(self.send_tool_list_changed())
+        self._notification_tasks.add(task)
+        task.add_done_callback(self._on_notification_done)
+        return task
+
+    def _on_notification_done(self, task: asyncio.Task):
+        self._notification_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error("Failed to send tool list changed notification: %s", task.exception())
+
     def register_refresh_tool(self):
         """Register the tool to refresh the tool list."""
         async def refresh_tools() -> str:
@@ -181,22 +293,28 @@ class ToolRegistry:
                 if not copilot_id:
                     return "No copilot ID available - unable to refresh tools. Please ensure you're authenticated and have access to a copilot."
                 
-                # Clear existing tools (except built-in ones)
-                self.clear_tools()
-                
-                # Re-register the refresh tool so it's always available
-                self.register_refresh_tool()
-                
-                # Register dynamic tools for the current copilot
-                await self._register_dynamic_tools(copilot_id)
+                # Hold the registration lock so a concurrent list_tools() can't interleave
+                async with self._registration_lock:
+                    # Clear existing tools (except built-in ones)
+                    self.clear_tools()
+                    
+                    # Drop cached skills so the copilot's current skills are fetched
+                    SkillService.invalidate(copilot_id)
+
+                    # Register dynamic tools for the current copilot
+                    await self._register_dynamic_tools(copilot_id, refresh=True)
+                    self._registered_copilot_id = copilot_id
+                    
+                    # Re-register the refresh tool afterwards; dynamic registration clears the registry
+                    self.register_refresh_tool()
                 
-                # Send notification that tool list changed
-                await self.send_tool_list_changed()
+                # Notify clients without holding the tool's response on the send
+                self.notify_tool_list_changed()
                 
                 return f"Successfully refreshed tools for copilot {copilot_id}. New tools should now be available to clients that support refreshing tools. Tell the user that currently Claude Code and Claude Desktop do not support this feature."
                 
             except Exception as e:
-                logging.error(f"Failed to refresh tools: {e}")
+                logger.error("Failed to refresh tools: %s", e)
                 return f"Error refreshing tools: {str(e)}. Please check the logs for more details."
         
         self.mcp.add_tool(
@@ -206,10 +324,12 @@ class ToolRegistry:
             structured_output=True
         )
         
-        logging.info("Registered refresh_tools tool")
+        logger.info("Registered refresh_tools tool")
     
     def clear_tools(self):
         """Clear all registered tools."""
+        self._registered_copilot_id = None
+        self._registered_key = None
         if hasattr(self.mcp, '_tool_manager') and hasattr(self.mcp._tool_manager, '_tools'):
             self.mcp._tool_manager._tools.clear()
-            logging.info("Cleared all tools from registry")
\ No newline at end of file
+            logger.debug("Cleared all tools from registry")
\ No newline at end of file
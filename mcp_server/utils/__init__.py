@@ -1,19 +1,50 @@
-"""Utility classes for the MCP server."""
+"""Utility classes for the MCP server.
 
-from .context import RequestContextExtractor
-from .client import ClientManager
-from .copilot import CopilotService
-from .skill import SkillService
-from .tool import ToolFactory
-from .validation import ArgumentValidator
-from mcp_server.auth.fastmcp_extended import FastMCPExtended
+Exports are imported lazily (PEP 562), so importing one helper module such as
+``mcp_server.utils.cache`` doesn't pull in the SDK and server stack.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .context import RequestContextExtractor
+    from .client import ClientManager
+    from .copilot import CopilotService
+    from .skill import SkillService
+    from .tool import ToolFactory
+    from .validation import ArgumentValidator
+    from mcp_server.auth.fastmcp_extended import FastMCPExtended
+
+_EXPORTS = {
+    "RequestContextExtractor": ".context",
+    "ClientManager": ".client",
+    "CopilotService": ".copilot",
+    "SkillService": ".skill",
+    "ToolFactory": ".tool",
+    "ArgumentValidator": ".validation",
+    "FastMCPExtended": "mcp_server.auth.fastmcp_extended",
+}
 
 __all__ = [
-    "RequestContextExtractor", 
+    "RequestContextExtractor",
     "ClientManager",
     "CopilotService",
     "SkillService",
     "ToolFactory",
     "ArgumentValidator",
     "FastMCPExtended",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
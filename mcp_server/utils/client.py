@@ -1,25 +1,61 @@
 """AnswerRocket client management utilities."""
 
 import sys
+import asyncio
 import logging
+import threading
+import weakref
 from typing import Optional
 from answer_rocket.client import AnswerRocketClient
 from mcp.server.fastmcp.server import Context
 
+from .cache import TTLCache, token_digest
 from .context import RequestContextExtractor
 
+logger = logging.getLogger(__name__)
+
 
 class ClientManager:
     """Manages AnswerRocket client creation and validation."""
+
+    # (ar_url, token digest) -> client. Bounded and time-limited so rotated tokens age out.
+    _clients = TTLCache(ttl=300.0, maxsize=64)
+    _clients_lock = threading.Lock()
+    # Clients that passed the connectivity probe; entries go away with the client.
+    _connected_clients: "weakref.WeakSet[AnswerRocketClient]" = weakref.WeakSet()
+
+    @classmethod
+    def get_client(cls, ar_url: str, token: str) -> AnswerRocketClient:
+        """Return a cached AnswerRocket client for this URL and token, creating it on a miss."""
+        key = (ar_url, token_digest(token))
+        with cls._clients_lock:
+            client = cls._clients.get(key)
+            if client is None:
+                client = AnswerRocketClient(ar_url, token)
+                cls._clients.set(key, client)
+            return client
     
+    @classmethod
+    async def ensure_connected(cls, client: AnswerRocketClient) -> bool:
+        """Check connectivity once per client; cached clients skip the probe afterwards."""
+        with cls._clients_lock:
+            if client in cls._connected_clients:
+                return True
+        # can_connect() is a blocking GraphQL ping; keep it off the event loop.
+        if not await asyncio.to_thread(client.can_connect):
+            return False
+        with cls._clients_lock:
+            cls._connected_clients.add(client)
+        return True
+
     @staticmethod
     def create_client(ar_url: str, ar_token: str) -> AnswerRocketClient:
         """Create and validate AnswerRocket client."""
         client = AnswerRocketClient(ar_url, ar_token)
         
         if not client.can_connect():
-            logging.error(f"Error: Cannot connect to AnswerRocket at {ar_url}")
-            logging.error("Please check your AR_URL and AR_TOKEN")
+            logger.error("Error: Cannot connect to AnswerRocket at %s", ar_url)
+            logger.error("Please check your AR_URL and AR_TOKEN")
             sys.exit(1)
             
         return client
@@ -37,8 +73,15 @@ class ClientManager:
             return None
         
         try:
-            client = AnswerRocketClient(ar_url, token_to_use)
-            return client
+            return ClientManager.get_client(ar_url, token_to_use)
         except Exception as e:
-            logging.error(f"Error creating client: {e}")
-            return None 
\ No newline at end of file
+            logger.error("Error creating client: %s", e)
+            return None 
+
+    @staticmethod
+    async def get_validated_client(context: Context, ar_url: str, fallback_token: Optional[str] = None) -> Optional[AnswerRocketClient]:
+        """Return the cached client for this request's token, or None if none is available or it can't connect."""
+        client = ClientManager.create_client_from_context(context, ar_url, fallback_token)
+        if client is None or not await ClientManager.ensure_connected(client):
+            return None
+        return client
@@ -3,6 +3,12 @@
 import logging
 from typing import Optional
 from mcp.server.fastmcp.server import Context
+from starlette_context import context as request_scope
+
+logger = logging.getLogger(__name__)
+
+_AUTH_HEADER = b"authorization"
+_BEARER_PREFIX = b"Bearer "
 
 
 class RequestContextExtractor:
@@ -16,22 +22,34 @@ class RequestContextExtractor:
             if not request or not hasattr(request, 'headers'):
                 return None
             
-            auth_header = request.headers.get('authorization', '')
-            if auth_header.startswith('Bearer '):
-                return auth_header[7:]
+            headers = request.headers
+            # Starlette's Headers.get is already case-insensitive over the raw list,
+            # so a miss there means the raw headers won't match either.
+            if hasattr(headers, 'get'):
+                auth_header = headers.get('authorization') or ''
+                return auth_header[7:] if auth_header.startswith('Bearer ') else None
             
-            if hasattr(request.headers, 'raw'):
-                for header_name, header_value in request.headers.raw:
-                    if header_name.lower() == b'authorization':
-                        auth_value = header_value.decode('utf-8')
-                        if auth_value.startswith('Bearer '):
-                            return auth_value[7:]
+            if hasattr(headers, 'raw'):
+                for header_name, header_value in headers.raw:
+                    if header_name.lower() == _AUTH_HEADER:
+                        if header_value.startswith(_BEARER_PREFIX):
+                            return header_value[7:].decode('ascii')
+                        break
                             
         except Exception as e:
-            logging.error(f"Error extracting bearer token: {e}")
+            logger.error("Error extracting bearer token: %s", e)
             
         return None
 
+    @staticmethod
+    def extract_ar_url(context: Context) -> str:
+        """Extract the AR URL for remote mode, reusing the base URL the middleware already resolved."""
+        if request_scope.exists():
+            base_url = request_scope.get("base_url")
+            if base_url:
+                return base_url.rstrip("/")
+        return str(context.request_context.request.base_url).rstrip("/")
+
     @staticmethod
     def extract_copilot_id(context: Context) -> Optional[str]:
         """Extract copilot ID from request path parameters for remote mode."""
@@ -1,17 +1,46 @@
 """Skill-related operations and configurations."""
 
 import logging
-from typing import List
-from answer_rocket.client import AnswerRocketClient
+from typing import TYPE_CHECKING, List, Optional
 
 from mcp_server.skill_parameter import HydratedSkillConfig
+from .cache import TTLCache, token_digest
+
+if TYPE_CHECKING:
+    from answer_rocket.client import AnswerRocketClient
+
+logger = logging.getLogger(__name__)
 
 
 class SkillService:
     """Handles skill-related operations and configurations."""
-    
+
+    # (ar_url, copilot_id, token digest) -> built skill configs; shared by every caller in the process.
+    _skill_cache = TTLCache(ttl=30.0, maxsize=256)
+
+    @staticmethod
+    def cache_key(ar_url: str, token: str, copilot_id: str) -> tuple:
+        """Cache key for a copilot's skills as seen by this token (skills can be permission-scoped)."""
+        return (ar_url, copilot_id, token_digest(token))
+
+    @classmethod
+    def get_cached_skill_configs(cls, key: tuple) -> Optional[List[HydratedSkillConfig]]:
+        """Return cached skill configs for ``key``, or None on a miss."""
+        return cls._skill_cache.get(key)
+
+    @classmethod
+    def cache_skill_configs(cls, key: tuple, skill_configs: List[HydratedSkillConfig]):
+        """Cache non-empty skill configs for ``key``."""
+        if skill_configs:
+            cls._skill_cache.set(key, skill_configs)
+
+    @classmethod
+    def invalidate(cls, copilot_id: str) -> int:
+        """Forget cached skill configs for ``copilot_id`` under every AR URL and token."""
+        return cls._skill_cache.discard_if(lambda key: key[1] == copilot_id)
+
     @staticmethod
-    def fetch_hydrated_reports(client: AnswerRocketClient, copilot_id: str, load_all_skills: bool = False) -> List[HydratedSkillConfig]:
+    def fetch_hydrated_reports(client: "AnswerRocketClient", copilot_id: str, load_all_skills: bool = False) -> List[HydratedSkillConfig]:
         """Fetch hydrated reports for a copilot."""
         try:
             hydrated_reports = client.config.get_copilot_hydrated_reports(
@@ -20,7 +49,7 @@ class SkillService:
             )
             
             if not hydrated_reports:
-                logging.warning(f"No hydrated reports found for copilot {copilot_id}")
+                logger.warning("No hydrated reports found for copilot %s", copilot_id)
                 return []
             
             skill_configs = []
@@ -29,9 +58,9 @@ class SkillService:
                 if skill_config:
                     skill_configs.append(skill_config)
             
-            logging.info(f"Processed {len(skill_configs)} skills from hydrated reports for copilot {copilot_id}")
+            logger.debug("Processed %d skills from hydrated reports for copilot %s", len(skill_configs), copilot_id)
             return skill_configs
         
-        except Exception as e:
-            logging.error(f"Error fetching hydrated reports for copilot {copilot_id}: {e}")
+        except Exception:
+            logger.exception("Error fetching hydrated reports for copilot %s", copilot_id)
             return []
\ No newline at end of file
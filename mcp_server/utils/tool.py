@@ -1,6 +1,8 @@
 """MCP tool creation and management utilities."""
 
+import asyncio
 import inspect
+import sys
 from typing import Callable, Optional, Dict, Any, Annotated
 from mcp.types import ToolAnnotations
 from mcp.server.fastmcp.server import Context
@@ -9,7 +11,6 @@ from pydantic import Field
 from mcp_server.skill_parameter import HydratedSkillConfig
 from .context import RequestContextExtractor
 from .client import ClientManager
-from .validation import ArgumentValidator
 
 
 class ToolFactory:
@@ -18,30 +19,25 @@ class ToolFactory:
     @staticmethod
     def create_tool_annotations(skill_config: HydratedSkillConfig) -> ToolAnnotations:
         """Create ToolAnnotations for a skill."""
-        return ToolAnnotations(
-            title=skill_config.detailed_name,
-            readOnlyHint=not skill_config.is_scheduling_only,
-            destructiveHint=False,
-            idempotentHint=True,
-            openWorldHint=True
-        )
+        return skill_config.annotations
 
     @staticmethod
-    def create_skill_tool_function(
-        skill_config: HydratedSkillConfig, 
-        ar_url: str, 
-        ar_token: Optional[str] = None, 
+    def make_skill_tool_factory(
+        ar_url: str,
+        ar_token: Optional[str] = None,
         copilot_id: Optional[str] = None
-    ) -> Callable:
-        """Create a tool function for a skill with proper signature."""
-        
-        async def skill_tool_function(context: Context, **kwargs) -> str:
-            """Execute this AnswerRocket skill."""
+    ) -> Callable[[HydratedSkillConfig], Callable]:
+        """Bind the server-wide arguments once; the returned factory only takes a skill config.
+
+        The connection settings live in one shared runner; each skill's tool function
+        only closes over its own config.
+        """
+        async def run_skill(context: Context, skill_config: HydratedSkillConfig, kwargs: Dict[str, Any]) -> str:
             try:
-                processed_params = ArgumentValidator.validate_skill_arguments(kwargs, skill_config)
+                processed_params = skill_config.argument_validator(kwargs)
                 
-                client = ClientManager.create_client_from_context(context, ar_url, ar_token)
-                if not client or not client.can_connect():
+                client = await ClientManager.get_validated_client(context, ar_url, ar_token)
+                if not client:
                     raise ValueError("Cannot connect to AnswerRocket")
                 
                 actual_copilot_id = copilot_id or RequestContextExtractor.extract_copilot_id(context)
@@ -51,9 +47,11 @@ class ToolFactory:
                 await context.info(f"Executing skill: {skill_config.skill_name}")
 
                 # Don't pass validate_parameters: older Max workers reject the kwarg.
-                skill_result = client.skill.run(actual_copilot_id,
-                                                skill_config.skill_name,
-                                                processed_params)
+                # skill.run blocks until the skill finishes; run it off the event loop.
+                skill_result = await asyncio.to_thread(client.skill.run,
+                                                       actual_copilot_id,
+                                                       skill_config.skill_name,
+                                                       processed_params)
                 
                 if not skill_result.success:
                     error_msg = f"Skill execution failed: {skill_result.error}"
@@ -73,16 +71,44 @@ class ToolFactory:
                 error_msg = f"Error running skill {skill_config.skill_name}: {str(e)}"
                 await context.error(error_msg)
                 return error_msg
-        
-        ToolFactory._configure_function_metadata(skill_tool_function, skill_config)
-        return skill_tool_function
+
+        def create_skill_tool(skill_config: HydratedSkillConfig) -> Callable:
+            # Compile up front so registration, not the first call, pays for it.
+            skill_config.argument_validator
+
+            async def skill_tool_function(context: Context, **kwargs) -> str:
+                """Execute this AnswerRocket skill."""
+                return await run_skill(context, skill_config, kwargs)
+
+            ToolFactory._configure_function_metadata(skill_tool_function, skill_config)
+            return skill_tool_function
+
+        return create_skill_tool
+
+    @staticmethod
+    def create_skill_tool_function(
+        skill_config: HydratedSkillConfig, 
+        ar_url: str, 
+        ar_token: Optional[str] = None, 
+        copilot_id: Optional[str] = None
+    ) -> Callable:
+        """Create a tool function for a skill with proper signature."""
+        return ToolFactory.make_skill_tool_factory(ar_url, ar_token, copilot_id)(skill_config)
     
     @staticmethod
     def _configure_function_metadata(func: Callable, skill_config: HydratedSkillConfig):
         """Configure function metadata and signature."""
-        func.__name__ = f"skill_{skill_config.tool_name}"
+        func.__name__ = sys.intern(f"skill_{skill_config.tool_name}")
         func.__doc__ = skill_config.tool_description
-        
+
+        signature, annotations = ToolFactory._build_signature(skill_config)
+        if signature is not None:
+            func.__signature__ = signature
+        func.__annotations__ = annotations
+
+    @staticmethod
+    def _build_signature(skill_config: HydratedSkillConfig):
+        """Return ``(signature, annotations)`` for a skill's tool function."""
         sig_params = [
             inspect.Parameter("context", inspect.Parameter.KEYWORD_ONLY, annotation=Context)
         ]
@@ -117,7 +143,6 @@ class ToolFactory:
         annotations["return"] = str
         
         try:
-            func.__signature__ = inspect.Signature(sig_params, return_annotation=str)
-            func.__annotations__ = annotations
+            return inspect.Signature(sig_params, return_annotation=str), annotations
         except Exception:
-            func.__annotations__ = {"context": Context, "return": str}
\ No newline at end of file
+            return None, {"context": Context, "return": str}
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Argument validation utilities."""
 import json
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 from mcp_server.skill_parameter import HydratedSkillConfig
 
 
@@ -10,44 +10,78 @@ class ArgumentValidator:
     @staticmethod
     def validate_skill_arguments(args: Dict[str, Any], skill_config: HydratedSkillConfig) -> Dict[str, Any]:
         """Validate and process skill arguments with constraint checking."""
-        validated_args = {}
-        
-        for param in skill_config.parameters:
-            if param.name not in args:
-                if param.required:
-                    raise ValueError(f"Missing required parameter: {param.name}")
-                continue
-                
-            value = args[param.name]
-            if value is None:
-                continue
-            
-            if param.constrained_values:
-                ArgumentValidator._validate_constraints(param.name, value, param.constrained_values, param.is_multi)
-            
-            # Ensure multi-value parameters are lists
-            if param.is_multi and not isinstance(value, list):
-                value = [value]
-                
-            validated_args[param.name] = value
-        
-        return validated_args
+        return skill_config.argument_validator(args)
+
+    @staticmethod
+    def compile_validator(skill_config: HydratedSkillConfig) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Build the skill's argument validator (cached as ``skill_config.argument_validator``).
+
+        The closure captures the precomputed required names, declaration order and
+        parameter specs, so a call doesn't re-read the schema.
+        """
+        required = skill_config.required_parameter_names
+        declared_order = tuple(param.name for param in skill_config.parameters)
+        specs = skill_config.parameter_specs
+        validate_constraints = ArgumentValidator._validate_constraints
+
+        def validate(args: Dict[str, Any]) -> Dict[str, Any]:
+            if required:
+                missing = required.difference(args)
+                if missing:
+                    name = next(name for name in declared_order if name in missing)
+                    raise ValueError(f"Missing required parameter: {name}")
+
+            validated_args = {}
+
+            # Walk the supplied arguments (usually far fewer than the declared parameters).
+            for name, value in args.items():
+                spec = specs.get(name)
+                if spec is None or value is None:
+                    continue
+                is_multi, constrained_values, allowed = spec
+
+                if constrained_values:
+                    validate_constraints(name, value, constrained_values, is_multi, allowed)
+
+                # Ensure multi-value parameters are lists
+                if is_multi and not isinstance(value, list):
+                    value = [value]
+
+                validated_args[name] = value
+
+            return validated_args
+
+        return validate
     
     @staticmethod
-    def _validate_constraints(param_name: str, value: Any, allowed_values: list, is_multi: bool):
+    def _validate_constraints(param_name: str, value: Any, allowed_values: list, is_multi: bool, allowed_set: Optional[frozenset] = None):
         """Validate value against allowed constraints. Not really necessary with the good LLMs. They have enough
         context to infer.
+
+        ``allowed_set`` is used for membership; ``allowed_values`` only for the error message.
         """
+        if allowed_set is None:
+            allowed_set = frozenset(allowed_values)
         if is_multi:
             values = value if isinstance(value, list) else [value]
-            invalid = [v for v in values if v not in allowed_values]
-            if invalid:
+            # Valid calls stop at the subset check; the offending values are only listed on failure.
+            try:
+                valid = allowed_set.issuperset(values)
+            except TypeError:
+                # Unhashable values (dicts, lists) can't be in the set; fall back to the list check.
+                valid = False
+            if not valid:
+                invalid = [v for v in values if v not in allowed_values]
                 raise ValueError(
                     f"Invalid values for {param_name}: {invalid}. "
                     f"Allowed values: {allowed_values}"
                 )
         else:
-            if value not in allowed_values:
+            try:
+                valid = value in allowed_set
+            except TypeError:
+                valid = False
+            if not valid:
                 raise ValueError(
                     f"Invalid value for {param_name}: {value}. "
                     f"Allowed values: {allowed_values}"
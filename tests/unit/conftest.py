@@ -0,0 +1,13 @@
+"""Shared fixtures for the unit tests."""
+import pytest
+
+from mcp_server.utils import SkillService
+from mcp_server.utils.cache import TTLCache
+
+
+@pytest.fixture
+def skill_cache(monkeypatch):
+    """A fresh in-memory skill cache, so tests don't see each other's fetches."""
+    cache = TTLCache(ttl=30.0)
+    monkeypatch.setattr(SkillService, "_skill_cache", cache)
+    return cache
@@ -0,0 +1,18 @@
+"""Builders shared by the unit tests."""
+from mcp_server.skill_parameter import HydratedSkillConfig, SkillParameter
+
+
+def skill_param(name, required=False, is_multi=False, constrained_values=None):
+    return SkillParameter(
+        name=name, type_hint=list if is_multi else str, description=name,
+        required=required, is_multi=is_multi, metadata_field=None,
+        constrained_values=constrained_values,
+    )
+
+
+def skill_config(name, *parameters):
+    return HydratedSkillConfig(
+        copilot_skill_id=f"id-{name}", name=name, tool_description=name,
+        detailed_description=name, tool_name=name, scheduling_only=False,
+        dataset_id=None, parameters=list(parameters),
+    )
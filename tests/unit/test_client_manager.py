@@ -0,0 +1,71 @@
+"""AnswerRocket clients are reused per (url, token) and the cache stays bounded."""
+import time
+import weakref
+
+import pytest
+
+from mcp_server.utils import ClientManager
+from mcp_server.utils import client as client_module
+from mcp_server.utils.cache import TTLCache
+
+
+class _FakeClient:
+    def __init__(self, url, token):
+        self.url = url
+        self.token = token
+
+
+@pytest.fixture(autouse=True)
+def fake_clients(monkeypatch):
+    monkeypatch.setattr(client_module, "AnswerRocketClient", _FakeClient)
+    monkeypatch.setattr(ClientManager, "_clients", TTLCache(ttl=300.0, maxsize=64))
+    monkeypatch.setattr(ClientManager, "_connected_clients", weakref.WeakSet())
+
+
+def test_same_url_and_token_reuse_client():
+    a = ClientManager.get_client("http://x", "tok")
+    assert ClientManager.get_client("http://x", "tok") is a
+    assert ClientManager.get_client("http://x", "other") is not a
+    assert ClientManager.get_client("http://y", "tok") is not a
+
+
+def test_cache_does_not_hold_raw_tokens():
+    ClientManager.get_client("http://x", "secret-token")
+    assert all("secret-token" not in key for key in ClientManager._clients._data)
+
+
+def test_least_recently_used_client_is_evicted(monkeypatch):
+    monkeypatch.setattr(ClientManager._clients, "maxsize", 2)
+    first = ClientManager.get_client("http://x", "1")
+    ClientManager.get_client("http://x", "2")
+    ClientManager.get_client("http://x", "1")  # refresh "1"
+    ClientManager.get_client("http://x", "3")  # evicts "2"
+    assert ClientManager.get_client("http://x", "1") is first
+    assert len(ClientManager._clients) == 2
+
+
+def test_expired_client_is_rebuilt(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    first = ClientManager.get_client("http://x", "tok")
+    now[0] += 301
+    assert ClientManager.get_client("http://x", "tok") is not first
+
+
+@pytest.mark.asyncio
+async def test_connectivity_is_probed_once_per_client():
+    probes = []
+
+    class _ProbedClient(_FakeClient):
+        def can_connect(self):
+            probes.append(self.token)
+            return self.token != "bad"
+
+    ok = _ProbedClient("http://x", "tok")
+    assert await ClientManager.ensure_connected(ok)
+    assert await ClientManager.ensure_connected(ok)
+    bad = _ProbedClient("http://x", "bad")
+    assert not await ClientManager.ensure_connected(bad)
+    assert not await ClientManager.ensure_connected(bad)
+    assert probes == ["tok", "bad", "bad"]
+    assert not hasattr(ok, "_mcp_connected")
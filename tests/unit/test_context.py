@@ -0,0 +1,25 @@
+"""Bearer token extraction from request headers."""
+from types import SimpleNamespace
+
+from starlette.datastructures import Headers
+
+from mcp_server.utils import RequestContextExtractor
+
+
+def _context(headers):
+    return SimpleNamespace(request_context=SimpleNamespace(request=SimpleNamespace(headers=headers)))
+
+
+def test_bearer_token_from_starlette_headers_any_case():
+    headers = Headers({"Authorization": "Bearer abc"})
+    assert RequestContextExtractor.extract_bearer_token(_context(headers)) == "abc"
+
+
+def test_non_bearer_authorization_is_ignored():
+    headers = Headers(raw=[(b"authorization", b"Basic abc")])
+    assert RequestContextExtractor.extract_bearer_token(_context(headers)) is None
+
+
+def test_raw_only_headers_fall_back_to_scan():
+    headers = SimpleNamespace(raw=[(b"host", b"x"), (b"AUTHORIZATION", b"Bearer abc")])
+    assert RequestContextExtractor.extract_bearer_token(_context(headers)) == "abc"
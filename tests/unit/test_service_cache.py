@@ -0,0 +1,42 @@
+"""Shared TTL cache behaviour and per-token skill caching."""
+import time
+
+from mcp_server.utils import SkillService
+from mcp_server.utils.cache import TTLCache
+
+
+def test_entries_expire(monkeypatch):
+    cache = TTLCache(ttl=10)
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+    now[0] += 11
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def test_skill_cache_key_is_token_scoped():
+    a = SkillService.cache_key("http://x", "token-a", "cop")
+    b = SkillService.cache_key("http://x", "token-b", "cop")
+    assert a != b
+    assert "token-a" not in a
+
+
+def test_invalidate_drops_only_that_copilot(skill_cache):
+    for token, copilot_id in (("a", "cop"), ("b", "cop"), ("a", "other")):
+        SkillService.cache_skill_configs(SkillService.cache_key("http://x", token, copilot_id), ["skill"])
+
+    assert SkillService.invalidate("cop") == 2
+    assert SkillService.get_cached_skill_configs(SkillService.cache_key("http://x", "a", "cop")) is None
+    assert SkillService.get_cached_skill_configs(SkillService.cache_key("http://x", "a", "other")) == ["skill"]
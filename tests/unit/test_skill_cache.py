@@ -0,0 +1,113 @@
+"""Disk-cached skill configs: round-trip, expiry, and stale-while-revalidate in the registry."""
+import asyncio
+import os
+import time
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from mcp_server.cache import SkillDiskCache
+from mcp_server.tool_registry import ToolRegistry
+from mcp_server.utils import SkillService
+
+from .helpers import skill_config, skill_param
+
+
+def _config(name):
+    return skill_config(name, skill_param("metrics", required=True, is_multi=True))
+
+
+def test_round_trip(tmp_path):
+    cache = SkillDiskCache(tmp_path)
+    cache.store("http://x", "tok", "cop", [_config("trend")])
+    configs, age = cache.load("http://x", "tok", "cop")
+    assert configs == [_config("trend")]
+    assert age < 5
+    assert cache.load("http://x", "other-token", "cop") is None
+
+
+def test_expired_and_corrupt_entries_are_ignored(tmp_path):
+    cache = SkillDiskCache(tmp_path, ttl=60)
+    cache.store("http://x", "tok", "cop", [_config("trend")])
+    path = cache._path("http://x", "tok", "cop")
+
+    old = time.time() - 120
+    os.utime(path, (old, old))
+    assert cache.load("http://x", "tok", "cop") is None
+
+    path.write_bytes(b"not a pickle")
+    assert cache.load("http://x", "tok", "cop") is None
+
+
+@pytest.mark.asyncio
+async def test_registry_serves_disk_cache_then_revalidates(tmp_path, monkeypatch, skill_cache):
+    cache = SkillDiskCache(tmp_path)
+    cache.store("http://x", "tok", "cop", [_config("trend")])
+    fetched = asyncio.Event()
+
+    def fake_fetch(client, copilot_id, load_all_skills=False):
+        fetched.set()
+        return [_config("trend"), _config("kpi")]
+    monkeypatch.setattr(SkillService, "fetch_hydrated_reports", staticmethod(fake_fetch))
+
+    reg = ToolRegistry(mcp=FastMCP("test"), ar_url="http://x", ar_token="tok",
+                       copilot_id="cop", skill_disk_cache=cache)
+    reg.setup_dynamic_registration()
+
+    tools = await reg._locked_list_tools("cop")
+    assert [t.name for t in tools] == ["trend"]
+
+    await asyncio.wait_for(fetched.wait(), 5)
+    await asyncio.gather(*reg._refresh_tasks.values())
+    configs, _ = cache.load("http://x", "tok", "cop")
+    assert [c.tool_name for c in configs] == ["trend", "kpi"]
+
+
+def test_store_prunes_expired_entries(tmp_path):
+    cache = SkillDiskCache(tmp_path, ttl=60)
+    cache.store("http://x", "old-token", "cop", [_config("trend")])
+    stale = cache._path("http://x", "old-token", "cop")
+    old = time.time() - 120
+    os.utime(stale, (old, old))
+
+    cache.store("http://x", "new-token", "cop", [_config("trend")])
+    assert not stale.exists()
+    assert cache.load("http://x", "new-token", "cop") is not None
+
+
+def test_shared_directory_is_not_trusted(tmp_path):
+    cache = SkillDiskCache(tmp_path / "skills")
+    cache.store("http://x", "tok", "cop", [_config("trend")])
+    os.chmod(cache.directory, 0o777)
+
+    assert cache.load("http://x", "tok", "cop") is None
+    cache.store("http://x", "tok", "other", [_config("trend")])
+    assert not cache._path("http://x", "tok", "other").exists()
+
+
+def test_mode_bits_are_not_checked_without_posix_ownership(tmp_path, monkeypatch):
+    cache = SkillDiskCache(tmp_path / "skills")
+    cache.store("http://x", "tok", "cop", [_config("trend")])
+    os.chmod(cache.directory, 0o777)
+    monkeypatch.delattr(os, "getuid")
+
+    assert cache.load("http://x", "tok", "cop") is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_background_revalidation_is_logged(tmp_path, monkeypatch, caplog, skill_cache):
+    cache = SkillDiskCache(tmp_path)
+    cache.store("http://x", "tok", "cop", [_config("trend")])
+
+    def failing_fetch(client, copilot_id, load_all_skills=False):
+        raise RuntimeError("AR unavailable")
+    monkeypatch.setattr(SkillService, "fetch_hydrated_reports", staticmethod(failing_fetch))
+
+    reg = ToolRegistry(mcp=FastMCP("test"), ar_url="http://x", ar_token="tok",
+                       copilot_id="cop", skill_disk_cache=cache)
+    reg.setup_dynamic_registration()
+    await reg._locked_list_tools("cop")
+
+    await asyncio.gather(*reg._refresh_tasks.values(), return_exceptions=True)
+    await asyncio.sleep(0)
+    assert "AR unavailable" in caplog.text
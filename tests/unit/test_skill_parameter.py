@@ -49,3 +49,9 @@ def test_multi_param_type_hint():
 def test_constrained_values_stringified():
     p = SkillParameter.from_hydrated_parameter(_param(constrained_values=[1, 2, 3]))
     assert p.constrained_values == ["1", "2", "3"]
+
+
+def test_constrained_values_set_matches_list():
+    p = SkillParameter.from_hydrated_parameter(_param(constrained_values=[1, 2, 2]))
+    assert p.constrained_values_set == frozenset({"1", "2"})
+    assert SkillParameter.from_hydrated_parameter(_param()).constrained_values_set == frozenset()
@@ -24,3 +24,15 @@ def test_remote_streamable_http_app_builds():
     app = server.streamable_http_app()
     paths = [getattr(r, "path", None) for r in app.routes]
     assert any("/mcp/agent/" in (p or "") for p in paths)
+
+
+def test_resource_server_url_brackets_ipv6_once():
+    from mcp_server.config import ServerConfig
+
+    def url(host):
+        return ServerConfig(mode="remote", ar_url=None, host=host, port=9098,
+                            transport="streamable-http").resource_server_url
+
+    assert url("localhost") == "http://localhost:9098"
+    assert url("::1") == url("[::1]") == "http://[::1]:9098"
+    assert url("mcp.example.com") == "https://mcp.example.com:9098"
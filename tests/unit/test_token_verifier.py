@@ -1,9 +1,18 @@
 """Introspection host allowlist + token validation."""
+import base64
+import json
+
 import httpx
+import jwt
 import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
 from starlette_context import request_cycle_context
 
-from mcp_server.auth.token_verifier import IntrospectionTokenVerifier
+from mcp_server.auth.token_verifier import (
+    CachingIntrospectionTokenVerifier,
+    IntrospectionTokenVerifier,
+    LocalJWTVerifier,
+)
 
 ACTIVE = {"active": True, "client_id": "c1", "scope": "read:copilots ping",
           "exp": 9999999999, "aud": "http://localhost:1234"}
@@ -13,6 +22,7 @@ class _FakeResp:
     def __init__(self, data, status=200):
         self.status_code = status
         self._data = data
+        self.content = json.dumps(data).encode()
 
     def json(self):
         return self._data
@@ -72,3 +82,173 @@ async def test_empty_allowlist_still_works_with_warning(monkeypatch):
     with request_cycle_context({"base_url": "http://localhost:1234/"}):
         result = await verifier.verify_token("good-token")
     assert result is not None
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_reused_across_calls(monkeypatch):
+    created = []
+    factory = _fake_client_factory(ACTIVE)
+
+    def _counting_factory(*a, **k):
+        created.append(1)
+        return factory(*a, **k)
+    monkeypatch.setattr(httpx, "AsyncClient", _counting_factory)
+
+    verifier = IntrospectionTokenVerifier(allowed_hosts=("localhost:1234",))
+    with request_cycle_context({"base_url": "http://localhost:1234/"}):
+        assert await verifier.verify_token("good-token") is not None
+        assert await verifier.verify_token("good-token") is not None
+    assert len(created) == 1
+
+
+def test_validate_resource_audience_list():
+    verifier = IntrospectionTokenVerifier(validate_resource=True)
+    url = "http://localhost:1234"
+    assert verifier._validate_resource({"aud": ["http://other", url + "/"]}, url, url)
+    assert verifier._validate_resource({"aud": ["http://other", url]}, url + "/mcp", url)
+    assert not verifier._validate_resource({"aud": ["http://other"]}, url, url)
+
+
+@pytest.mark.asyncio
+async def test_introspection_body_is_form_encoded(monkeypatch):
+    sent = {}
+    monkeypatch.setattr(httpx, "AsyncClient",
+                        _fake_client_factory(ACTIVE, on_post=lambda url, kw: sent.update(kw)))
+    verifier = IntrospectionTokenVerifier(allowed_hosts=("localhost:1234",))
+    with request_cycle_context({"base_url": "http://localhost:1234/"}):
+        await verifier.verify_token("a+b/c=d")
+    assert sent["content"] == b"token=a%2Bb%2Fc%3Dd"
+    assert sent["headers"]["Content-Type"] == "application/x-www-form-urlencoded"
+
+
+@pytest.mark.asyncio
+async def test_caching_verifier_skips_repeat_introspection(monkeypatch):
+    posts = []
+    monkeypatch.setattr(httpx, "AsyncClient",
+                        _fake_client_factory(ACTIVE, on_post=lambda url, kw: posts.append(url)))
+    verifier = CachingIntrospectionTokenVerifier(allowed_hosts=("localhost:1234", "other:1234"))
+    with request_cycle_context({"base_url": "http://localhost:1234/"}):
+        first = await verifier.verify_token("good-token")
+        assert await verifier.verify_token("good-token") is first
+    assert len(posts) == 1
+
+    # A different host is a different cache entry.
+    with request_cycle_context({"base_url": "https://other:1234/"}):
+        assert await verifier.verify_token("good-token") is not None
+    assert len(posts) == 2
+
+
+@pytest.mark.asyncio
+async def test_caching_verifier_does_not_cache_rejections(monkeypatch):
+    posts = []
+    monkeypatch.setattr(httpx, "AsyncClient",
+                        _fake_client_factory({"active": False}, on_post=lambda url, kw: posts.append(url)))
+    verifier = CachingIntrospectionTokenVerifier(allowed_hosts=("localhost:1234",))
+    with request_cycle_context({"base_url": "http://localhost:1234/"}):
+        assert await verifier.verify_token("bad-token") is None
+        assert await verifier.verify_token("bad-token") is None
+    assert len(posts) == 2
+
+
+_RSA_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+_JWT_CLAIMS = {"client_id": "c1", "scope": "read:copilots ping", "exp": 9999999999,
+               "aud": "http://localhost:1234", "iss": "http://localhost:1234"}
+
+
+def _jwt(kid="k1", **overrides):
+    claims = {k: v for k, v in {**_JWT_CLAIMS, **overrides}.items() if v is not None}
+    return jwt.encode(claims, _RSA_KEY, algorithm="RS256", headers={"kid": kid})
+
+
+class _FakeJWKSClient:
+    """Stands in for PyJWKClient: serves one key (kid "k1") and counts fetches."""
+
+    def __init__(self, available=True):
+        self.available = available
+        self.fetches = 0
+
+    def get_signing_keys(self, refresh=False):
+        self.fetches += 1
+        if not self.available:
+            raise jwt.PyJWKClientError("Fail to fetch data from the url")
+        jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(_RSA_KEY.public_key()))
+        return [jwt.PyJWK.from_dict({**jwk, "kid": "k1"})]
+
+
+def _jwt_verifier(monkeypatch, jwks_client, **kwargs):
+    verifier = LocalJWTVerifier(allowed_hosts=("localhost:1234",), **kwargs)
+    monkeypatch.setattr(jwt, "PyJWKClient", lambda *a, **k: jwks_client)
+    return verifier
+
+
+@pytest.mark.asyncio
+async def test_jwt_verifier_verifies_locally(monkeypatch):
+    monkeypatch.setattr(httpx, "AsyncClient", _fake_client_factory({"active": False}))
+    jwks_client = _FakeJWKSClient()
+    verifier = _jwt_verifier(monkeypatch, jwks_client, validate_resource=True)
+    token = _jwt()
+    with request_cycle_context({"base_url": "http://localhost:1234/"}):
+        result = await verifier.verify_token(token)
+        # Repeat calls are served from the token cache without touching the JWKS.
+        assert await verifier.verify_token(token) is result
+        # A tampered signature is rejected rather than introspected.
+        assert await verifier.verify_token(token[:-4] + "AAAA") is None
+    assert result is not None
+    assert result.client_id == "c1"
+    assert "ping" in result.scopes
+    assert jwks_client.fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_jwt_verifier_rejects_foreign_issuer(monkeypatch):
+    verifier = _jwt_verifier(monkeypatch, _FakeJWKSClient())
+    with request_cycle_context({"base_url": "http://localhost:1234/"}):
+        assert await verifier.verify_token(_jwt(iss="https://other.example")) is None
+        assert await verifier.verify_token(_jwt(iss=None)) is None
+
+
+@pytest.mark.asyncio
+async def test_jwt_verifier_rejects_malformed_header_and_claims(monkeypatch):
+    verifier = _jwt_verifier(monkeypatch, _FakeJWKSClient(), validate_resource=True)
+    header = base64.urlsafe_b64encode(b'{"alg":"RS256","kid":1}').rstrip(b"=").decode()
+    non_string_kid = header + _jwt()[_jwt().index("."):]
+    with request_cycle_context({"base_url": "http://localhost:1234/"}):
+        assert await verifier.verify_token(non_string_kid) is None
+        assert await verifier.verify_token(_jwt(aud=["http://localhost:1234", 1])) is None
+
+
+@pytest.mark.asyncio
+async def test_jwt_verifier_refreshes_unknown_kid_once(monkeypatch):
+    jwks_client = _FakeJWKSClient()
+    verifier = _jwt_verifier(monkeypatch, jwks_client)
+    with request_cycle_context({"base_url": "http://localhost:1234/"}):
+        for kid in ("made-up-1", "made-up-2", "made-up-3"):
+            assert await verifier.verify_token(_jwt(kid=kid)) is None
+    # One cached lookup per token plus a single forced refresh for the first miss.
+    assert jwks_client.fetches == 4
+
+
+@pytest.mark.asyncio
+async def test_jwt_verifier_remembers_missing_jwks(monkeypatch):
+    posts = []
+    monkeypatch.setattr(httpx, "AsyncClient",
+                        _fake_client_factory(ACTIVE, on_post=lambda url, kw: posts.append(url)))
+    jwks_client = _FakeJWKSClient(available=False)
+    verifier = _jwt_verifier(monkeypatch, jwks_client)
+    with request_cycle_context({"base_url": "http://localhost:1234/"}):
+        for token in (_jwt(), _jwt(client_id="c2"), _jwt()):
+            assert await verifier.verify_token(token) is not None
+    assert jwks_client.fetches == 1
+    # The repeated token is answered from the introspection cache.
+    assert len(posts) == 2
+
+
+@pytest.mark.asyncio
+async def test_jwt_verifier_falls_back_to_introspection_for_opaque_tokens(monkeypatch):
+    posts = []
+    monkeypatch.setattr(httpx, "AsyncClient",
+                        _fake_client_factory(ACTIVE, on_post=lambda url, kw: posts.append(url)))
+    verifier = LocalJWTVerifier(allowed_hosts=("localhost:1234",))
+    with request_cycle_context({"base_url": "http://localhost:1234/"}):
+        assert await verifier.verify_token("arc-opaque-token") is not None
+    assert posts == ["http://localhost:1234/api/oauth2/introspect"]
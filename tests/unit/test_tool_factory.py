@@ -1,8 +1,13 @@
 """Tool generation: required params get no default; annotations reflect scheduling-only."""
 import inspect
+import threading
+import typing
+from types import SimpleNamespace
+
+import pytest
 
 from mcp_server.skill_parameter import SkillParameter, HydratedSkillConfig
-from mcp_server.utils import ToolFactory
+from mcp_server.utils import ClientManager, ToolFactory
 
 
 def _config(scheduling_only=False):
@@ -40,3 +45,54 @@ def test_annotations_read_only_for_non_scheduling():
     assert ann.readOnlyHint is True
     ann2 = ToolFactory.create_tool_annotations(_config(scheduling_only=True))
     assert ann2.readOnlyHint is False
+
+
+def test_bound_factory_matches_direct_creation():
+    factory = ToolFactory.make_skill_tool_factory("http://x", "tok", "cop")
+    fn = factory(_config())
+    direct = ToolFactory.create_skill_tool_function(_config(), "http://x", "tok", "cop")
+    def shape(f):
+        return [(p.name, p.kind, p.default, typing.get_origin(p.annotation) or p.annotation)
+                for p in inspect.signature(f).parameters.values()]
+    assert shape(fn) == shape(direct)
+    assert fn.__name__ == "skill_trend_analysis"
+
+
+def test_skill_tools_share_the_bound_connection_settings():
+    factory = ToolFactory.make_skill_tool_factory("http://x", "tok", "cop")
+    first, second = factory(_config()), factory(_config(scheduling_only=True))
+    # Each tool closes over its own config plus the one runner holding the settings.
+    assert sorted(first.__code__.co_freevars) == ["run_skill", "skill_config"]
+    assert first.__closure__[first.__code__.co_freevars.index("run_skill")].cell_contents is \
+        second.__closure__[second.__code__.co_freevars.index("run_skill")].cell_contents
+
+
+@pytest.mark.asyncio
+async def test_skill_run_happens_off_the_event_loop(monkeypatch):
+    loop_thread = threading.get_ident()
+    run_threads = []
+
+    class _Skill:
+        def run(self, copilot_id, skill_name, params):
+            run_threads.append(threading.get_ident())
+            return SimpleNamespace(success=True, error=None, data={"final_message": "done"})
+
+    class _Client:
+        skill = _Skill()
+
+        def can_connect(self):
+            return True
+
+    client = _Client()
+    monkeypatch.setattr(ClientManager, "create_client_from_context", staticmethod(lambda *a: client))
+
+    class _Context:
+        async def info(self, msg):
+            pass
+
+        async def error(self, msg):
+            pass
+
+    fn = ToolFactory.create_skill_tool_function(_config(), "http://x", "tok", "cop")
+    assert await fn(context=_Context(), metrics=["sales"]) == "done"
+    assert run_threads and run_threads[0] != loop_thread
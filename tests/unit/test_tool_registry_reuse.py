@@ -0,0 +1,126 @@
+"""Repeated list_tools() for an unchanged copilot must reuse the registered tools."""
+import asyncio
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from mcp_server.tool_registry import ToolRegistry
+from mcp_server.utils import SkillService
+
+from .helpers import skill_config as _config
+
+
+@pytest.fixture
+def skills(monkeypatch, skill_cache):
+    """Each copilot's skills as the fake AnswerRocket serves them; tests may edit it."""
+    skills = {"cop": [_config("trend")], "other": [_config("kpi")]}
+
+    def fake_fetch(client, copilot_id, load_all_skills=False):
+        return list(skills[copilot_id])
+    monkeypatch.setattr(SkillService, "fetch_hydrated_reports", staticmethod(fake_fetch))
+    return skills
+
+
+def _make_registry(copilot_id=None):
+    reg = ToolRegistry(mcp=FastMCP("test"), ar_url="http://x", ar_token="tok", copilot_id=copilot_id)
+    reg.setup_dynamic_registration()
+    return reg
+
+
+@pytest.fixture
+def registry(skills):
+    return _make_registry()
+
+
+@pytest.fixture
+def registered(monkeypatch):
+    """Names of the skills passed to register_skills(), in order."""
+    calls = []
+    original = ToolRegistry.register_skills
+
+    def recording_register_skills(self, skill_configs, *args):
+        calls.extend(config.tool_name for config in skill_configs)
+        return original(self, skill_configs, *args)
+    monkeypatch.setattr(ToolRegistry, "register_skills", recording_register_skills)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_unchanged_skills_are_not_reregistered(registry, registered):
+
+    first = await registry._locked_list_tools("cop")
+    second = await registry._locked_list_tools("cop")
+
+    assert [t.name for t in first] == [t.name for t in second] == ["trend"]
+    assert registered == ["trend"]
+
+
+@pytest.mark.asyncio
+async def test_changed_skills_are_reregistered(registry, skills):
+    await registry._locked_list_tools("cop")
+    skills["cop"] = [_config("trend"), _config("kpi")]
+    SkillService._skill_cache.clear()
+
+    tools = await registry._locked_list_tools("cop")
+    assert sorted(t.name for t in tools) == ["kpi", "trend"]
+
+
+@pytest.mark.asyncio
+async def test_only_changed_skills_are_rebuilt(registry, skills, registered):
+    await registry._locked_list_tools("cop")
+    skills["cop"] = [_config("trend"), _config("kpi")]
+    SkillService._skill_cache.clear()
+
+    await registry._locked_list_tools("cop")
+    assert registered == ["trend", "kpi"]
+
+
+@pytest.mark.asyncio
+async def test_switching_copilots_restores_built_tools(registry, skills, registered):
+    for copilot_id in ("cop", "other", "cop", "other"):
+        tools = await registry._locked_list_tools(copilot_id)
+        assert [t.name for t in tools] == [c.tool_name for c in skills[copilot_id]]
+    assert registered == ["trend", "kpi"]
+
+
+@pytest.mark.asyncio
+async def test_background_notification_logs_failures(registry, monkeypatch, caplog):
+    async def failing_send():
+        raise RuntimeError("session closed")
+    monkeypatch.setattr(registry, "send_tool_list_changed", failing_send)
+
+    task = registry.notify_tool_list_changed()
+    with pytest.raises(RuntimeError):
+        await task
+    await asyncio.sleep(0)
+
+    assert "session closed" in caplog.text
+    assert not registry._notification_tasks
+
+
+@pytest.mark.asyncio
+async def test_refresh_tools_keeps_itself_registered(skills, monkeypatch):
+    registry = _make_registry(copilot_id="cop")
+    monkeypatch.setattr(registry, "notify_tool_list_changed", lambda: None)
+    registry.register_refresh_tool()
+    skills["cop"] = [_config("trend"), _config("kpi")]
+
+    refresh = registry.mcp._tool_manager._tools["refresh_tools"].fn
+    assert (await refresh()).startswith("Successfully refreshed")
+    assert sorted(registry.mcp._tool_manager._tools) == ["kpi", "refresh_tools", "trend"]
+
+
+@pytest.mark.asyncio
+async def test_changed_skills_notify_clients(registry, skills, monkeypatch):
+    notified = []
+    monkeypatch.setattr(registry, "notify_tool_list_changed", lambda: notified.append(True))
+
+    await registry._locked_list_tools("cop")
+    await registry._locked_list_tools("cop")
+    await registry._locked_list_tools("other")
+    assert notified == []
+
+    skills["other"] = [_config("trend"), _config("kpi")]
+    SkillService._skill_cache.clear()
+    await registry._locked_list_tools("other")
+    assert notified == [True]
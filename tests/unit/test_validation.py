@@ -0,0 +1,62 @@
+"""Skill argument validation: required params, constraints, multi-value coercion."""
+import pickle
+
+import pytest
+
+from mcp_server.utils import ArgumentValidator
+
+from .helpers import skill_config, skill_param as _param
+
+
+def _config(*parameters):
+    return skill_config("trend", *parameters)
+
+
+CONFIG = _config(
+    _param("metric", required=True, constrained_values=["sales", "units"]),
+    _param("regions", is_multi=True, constrained_values=["east", "west"]),
+    _param("note"),
+)
+
+
+def test_missing_required_parameter_is_reported():
+    with pytest.raises(ValueError, match="Missing required parameter: metric"):
+        ArgumentValidator.validate_skill_arguments({"note": "x"}, CONFIG)
+
+
+def test_valid_arguments_are_processed():
+    args = {"metric": "sales", "regions": "east", "note": None, "unknown": 1}
+    assert ArgumentValidator.validate_skill_arguments(args, CONFIG) == {"metric": "sales", "regions": ["east"]}
+
+
+def test_constraint_violations_are_rejected():
+    with pytest.raises(ValueError, match="Invalid value for metric"):
+        ArgumentValidator.validate_skill_arguments({"metric": "profit"}, CONFIG)
+    with pytest.raises(ValueError, match="Invalid values for regions"):
+        ArgumentValidator.validate_skill_arguments({"metric": "sales", "regions": ["east", "north"]}, CONFIG)
+
+
+def test_unhashable_values_are_rejected_with_constraint_error():
+    with pytest.raises(ValueError, match="Invalid value for metric"):
+        ArgumentValidator.validate_skill_arguments({"metric": {"x": 1}}, CONFIG)
+    with pytest.raises(ValueError, match=r"Invalid values for regions: \[\{'x': 1\}\]"):
+        ArgumentValidator.validate_skill_arguments({"metric": "sales", "regions": ["east", {"x": 1}]}, CONFIG)
+
+
+def test_validator_is_compiled_once_and_not_pickled():
+    config = _config(_param("metric", required=True))
+    validate = config.argument_validator
+    assert config.argument_validator is validate
+    assert validate({"metric": "sales"}) == {"metric": "sales"}
+
+    restored = pickle.loads(pickle.dumps(config))
+    assert restored == config
+    assert "argument_validator" not in restored.__dict__
+    assert restored.argument_validator({"metric": "sales"}) == {"metric": "sales"}
+
+
+def test_plain_parameters_pass_through_unchanged():
+    config = _config(_param("metric", required=True), _param("note"))
+    assert ArgumentValidator.validate_skill_arguments({"metric": "sales", "note": "x"}, config) == {"metric": "sales", "note": "x"}
+    assert ArgumentValidator.validate_skill_arguments({"metric": "sales", "note": None}, config) == {"metric": "sales"}
+    assert ArgumentValidator.validate_skill_arguments({"metric": "sales", "extra": 1}, config) == {"metric": "sales"}